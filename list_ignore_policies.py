@@ -20,6 +20,7 @@ import csv
 import requests
 from datetime import datetime
 from typing import Dict, List, Optional
+from urllib.parse import urljoin
 
 # Import from the main script
 try:
@@ -74,14 +75,7 @@ class IgnorePolicyFinder:
                 next_params = None
                 
                 if next_url:
-                    if next_url.startswith('http'):
-                        pass  # use as-is
-                    elif next_url.startswith('/'):
-                        next_url = self.snyk_api.base_url + next_url
-                    else:
-                        next_url = self.snyk_api.base_url + '/' + next_url.lstrip('/')
-                else:
-                    next_url = None
+                    next_url = urljoin(self.snyk_api.base_url + '/', next_url)
                     
                 page += 1
             except requests.exceptions.RequestException as e:
@@ -129,14 +123,7 @@ class IgnorePolicyFinder:
                 next_params = None
                 
                 if next_url:
-                    if next_url.startswith('http'):
-                        pass  # use as-is
-                    elif next_url.startswith('/'):
-                        next_url = self.snyk_api.base_url + next_url
-                    else:
-                        next_url = self.snyk_api.base_url + '/' + next_url.lstrip('/')
-                else:
-                    next_url = None
+                    next_url = urljoin(self.snyk_api.base_url + '/', next_url)
                     
                 page += 1
             except requests.exceptions.RequestException as e:
@@ -207,9 +194,30 @@ class IgnorePolicyFinder:
         return enriched_policies
 
 
+def get_policy_key_assets(policy: Dict) -> List[str]:
+    """
+    Return every key_asset a policy ignores.
+
+    Policies created by snyk_ignore_transfer for several issues sharing a reason, CWE and
+    title hold one snyk/asset/finding/v1 condition per issue.
+
+    Args:
+        policy: Policy from the policies API
+
+    Returns:
+        List of key_asset values, in condition order
+    """
+    conditions = policy.get('attributes', {}).get('conditions_group', {}).get('conditions', [])
+    return [condition.get('value', '') for condition in conditions
+            if condition.get('field') == 'snyk/asset/finding/v1']
+
+
 def save_to_csv(policies: List[Dict], filename: str, ignore_reason: str):
     """
     Save ignore policies and their events to a CSV file.
+
+    Writes one row per ignored key_asset, so a policy covering several issues
+    produces several rows.
     
     Args:
         policies: List of policies (enriched with events)
@@ -233,6 +241,7 @@ def save_to_csv(policies: List[Dict], filename: str, ignore_reason: str):
         'created_by_email'
     ]
     
+    rows_written = 0
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
@@ -244,29 +253,23 @@ def save_to_csv(policies: List[Dict], filename: str, ignore_reason: str):
             action_data = action.get('data', {})
             created_by = attributes.get('created_by', {})
             
-            # Extract key_asset from conditions
-            conditions_group = attributes.get('conditions_group', {})
-            conditions = conditions_group.get('conditions', [])
-            key_asset = ''
-            for condition in conditions:
-                if condition.get('field') == 'snyk/asset/finding/v1':
-                    key_asset = condition.get('value', '')
-                    break
-            
-            writer.writerow({
-                'policy_id': policy_id,
-                'policy_name': attributes.get('name', ''),
-                'action_type': attributes.get('action_type', ''),
-                'ignore_type': action_data.get('ignore_type', ''),
-                'reason': action_data.get('reason', ''),
-                'key_asset': key_asset,
-                'created_at': attributes.get('created_at', ''),
-                'updated_at': attributes.get('updated_at', ''),
-                'created_by_name': created_by.get('name', ''),
-                'created_by_email': created_by.get('email', '')
-            })
-    
-    print(f"   📄 Saved {len(policies)} policies to {filename}")
+            # One row per key_asset condition (a policy without one still gets a row)
+            for key_asset in get_policy_key_assets(policy) or ['']:
+                writer.writerow({
+                    'policy_id': policy_id,
+                    'policy_name': attributes.get('name', ''),
+                    'action_type': attributes.get('action_type', ''),
+                    'ignore_type': action_data.get('ignore_type', ''),
+                    'reason': action_data.get('reason', ''),
+                    'key_asset': key_asset,
+                    'created_at': attributes.get('created_at', ''),
+                    'updated_at': attributes.get('updated_at', ''),
+                    'created_by_name': created_by.get('name', ''),
+                    'created_by_email': created_by.get('email', '')
+                })
+                rows_written += 1
+    
+    print(f"   📄 Saved {len(policies)} policies ({rows_written} ignored key_assets) to {filename}")
 
 
 def print_summary(policies: List[Dict], ignore_reason: str, org_name: str = None):
@@ -286,6 +289,7 @@ def print_summary(policies: List[Dict], ignore_reason: str, org_name: str = None
         print(f"Organization: {org_name}")
     print(f"Ignore Reason: \"{ignore_reason}\"")
     print(f"Total Ignore Policies: {len(policies)}")
+    print(f"Total Ignored Key Assets: {sum(len(get_policy_key_assets(policy)) for policy in policies)}")
     
     if not policies:
         print("\nℹ️  No ignore policies found with this reason")
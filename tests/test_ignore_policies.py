@@ -0,0 +1,86 @@
+"""Tests for creating grouped ignore policies and listing them."""
+
+import csv
+import os
+import tempfile
+import unittest
+
+import requests
+
+from list_ignore_policies import get_policy_key_assets, save_to_csv
+from snyk_ignore_transfer import SnykAPI
+
+
+def response(status_code):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = b'{}'
+    resp.url = 'https://api.snyk.io/rest/orgs/org-1/policies'
+    return resp
+
+
+class FakeSession:
+    """Stand-in for requests.Session: the first POST gets first_status, later ones 201."""
+
+    def __init__(self, first_status):
+        self.first_status = first_status
+        self.posted = []
+
+    def post(self, url, json=None, headers=None):
+        self.posted.append(json)
+        return response(self.first_status if len(self.posted) == 1 else 201)
+
+
+class GroupedIgnorePolicyTests(unittest.TestCase):
+
+    def create(self, first_status, key_assets=('asset-1', 'asset-2', 'asset-3')):
+        api = SnykAPI('token')
+        api.session = FakeSession(first_status)
+        ignored = api.create_grouped_ignore_policy('org-1', list(key_assets), 'reason', 'CWE-79', 'XSS')
+        return ignored, api.session.posted
+
+    def test_grouped_policy_covers_all_key_assets(self):
+        ignored, posted = self.create(201)
+        self.assertEqual(ignored, 3)
+        self.assertEqual(len(posted), 1)
+        self.assertEqual(get_policy_key_assets(posted[0]['data']), ['asset-1', 'asset-2', 'asset-3'])
+
+    def test_rejected_grouped_policy_falls_back_to_one_policy_per_key_asset(self):
+        for status in (400, 422):
+            ignored, posted = self.create(status)
+            self.assertEqual(ignored, 3)
+            self.assertEqual(len(posted), 4)
+
+    def test_grouped_conflict_falls_back_to_one_policy_per_key_asset(self):
+        ignored, posted = self.create(409)
+        self.assertEqual(ignored, 3)
+        self.assertEqual(len(posted), 4)
+        self.assertEqual([get_policy_key_assets(body['data']) for body in posted[1:]],
+                         [['asset-1'], ['asset-2'], ['asset-3']])
+
+    def test_other_failures_are_not_retried_per_key_asset(self):
+        for status in (429, 500, 503):
+            ignored, posted = self.create(status)
+            self.assertEqual(ignored, 0)
+            self.assertEqual(len(posted), 1)
+
+
+class ListIgnorePoliciesTests(unittest.TestCase):
+
+    def test_csv_has_one_row_per_key_asset(self):
+        api = SnykAPI('token')
+        data = api._ignore_policy_data(['asset-1', 'asset-2'], 'reason', 'CWE-79', 'XSS')['data']
+        policy = {'id': 'policy-1', **data}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'policies.csv')
+            save_to_csv([policy], filename, 'reason')
+            with open(filename, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+
+        self.assertEqual([row['key_asset'] for row in rows], ['asset-1', 'asset-2'])
+        self.assertEqual({row['policy_id'] for row in rows}, {'policy-1'})
+
+
+if __name__ == '__main__':
+    unittest.main()
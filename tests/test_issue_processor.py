@@ -0,0 +1,95 @@
+"""Tests for fetching, enriching and caching Snyk issues."""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from snyk_ignore_transfer import Config, IssueProcessor, _find_org_matches, _issue_cache_path
+
+
+class FakeSnykAPI:
+    """Stand-in for SnykAPI that counts project detail requests."""
+
+    def __init__(self, failing_projects=()):
+        self.project_requests = []
+        self.failing_projects = set(failing_projects)
+        self._lock = threading.Lock()
+
+    def get_all_code_issues(self, org_id):
+        return [code_issue(f'issue-{i}', f'project-{i % 2}') for i in range(4)]
+
+    def get_targets_for_org(self, org_id):
+        return [{'id': 'target-1', 'attributes': {'url': 'https://github.com/acme/webapp'}}]
+
+    def get_project_details(self, org_id, project_id):
+        with self._lock:
+            self.project_requests.append(project_id)
+        time.sleep(0.01)  # Keep the request in flight so concurrent workers overlap
+        if project_id in self.failing_projects:
+            return None
+        return {'data': {
+            'attributes': {'target_reference': 'main'},
+            'relationships': {'target': {'data': {'id': 'target-1'}}},
+        }}
+
+    def get_issue_details(self, org_id, project_id, problem_id):
+        return None
+
+
+def code_issue(issue_id, project_id):
+    return {
+        'id': issue_id,
+        'attributes': {'problems': [{'id': f'problem-{issue_id}'}], 'classes': []},
+        'relationships': {
+            'organization': {'data': {'id': 'org-1'}},
+            'scan_item': {'data': {'id': project_id}},
+        },
+    }
+
+
+class ProjectDetailsTests(unittest.TestCase):
+
+    def test_project_details_fetched_once_per_project(self):
+        api = FakeSnykAPI()
+        processor = IssueProcessor(api)
+        issues = [code_issue(f'issue-{i}', f'project-{i % 2}') for i in range(20)]
+
+        enriched = processor.enrich_issues_with_targets('org-1', issues)
+        processed = processor.process_issues(enriched, max_workers=8)
+
+        self.assertEqual(sorted(api.project_requests), ['project-0', 'project-1'])
+        self.assertEqual(len(processed), 20)
+        self.assertEqual(processed[0]['key_data']['branch'], 'main')
+        self.assertEqual(processed[0]['key_data']['target_url'], 'https://github.com/acme/webapp')
+
+
+class IssueCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.object(Config, 'ISSUE_CACHE_DIR', cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.args = argparse.Namespace(no_cache=False, verbose=False, repo_url_field='repourl',
+                                       repo_name_matching=False, max_workers=2, df_match=False,
+                                       group_id=None)
+
+    def find_matches(self, api):
+        return _find_org_matches(IssueProcessor(api), api, self.args, 'org-1', csv_data=[])
+
+    def test_enriched_issues_are_cached(self):
+        self.find_matches(FakeSnykAPI())
+        self.assertTrue(os.path.exists(_issue_cache_path('org-1')))
+
+    def test_issues_not_cached_when_a_project_lookup_fails(self):
+        self.find_matches(FakeSnykAPI(failing_projects={'project-1'}))
+        self.assertFalse(os.path.exists(_issue_cache_path('org-1')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Regression tests for matching Snyk issues against CSV false positives."""
+
+import unittest
+
+from snyk_ignore_transfer import IssueProcessor
+
+REPO_URL = 'https://github.com/acme/webapp'
+
+
+def snyk_issue(issue_id='issue-1', cwe='CWE-79', file_path='src/app.js', branch='main',
+               target_url=REPO_URL, start_line=10, end_line=20):
+    """Build a processed issue as returned by IssueProcessor.process_issues."""
+    return {'key_data': {
+        'issue_id': issue_id,
+        'cwe': cwe,
+        'file_path': file_path,
+        'branch': branch,
+        'target_url': target_url,
+        'start_line': start_line,
+        'end_line': end_line,
+    }}
+
+
+def csv_row(cwe='CWE-79', file_path='src/app.js', branch='main', repourl=REPO_URL, line=''):
+    """Build a CSV false positive row."""
+    return {'false_p': 'TRUE', 'cwe': cwe, 'file_path': file_path, 'branch': branch,
+            'repourl': repourl, 'line': line}
+
+
+class MatcherTests(unittest.TestCase):
+
+    def setUp(self):
+        self.processor = IssueProcessor(snyk_api=None)
+
+    def test_df_matcher_matches_on_all_keys(self):
+        matches = self.processor.match_issues_with_csv_df([snyk_issue()], [csv_row()])
+        self.assertEqual(len(matches), 1)
+
+    def test_missing_cwe_does_not_match_missing_cwe(self):
+        issues = [snyk_issue(cwe=None)]
+        rows = [csv_row(cwe='')]
+        self.assertEqual(self.processor.match_issues_with_csv_df(issues, rows), [])
+        self.assertEqual(self.processor.match_issues_with_csv(issues, rows), [])
+
+    def test_missing_repo_url_does_not_match_missing_target_url(self):
+        issues = [snyk_issue(target_url=None)]
+        rows = [csv_row(repourl='')]
+        self.assertEqual(self.processor.match_issues_with_csv_df(issues, rows), [])
+        self.assertEqual(self.processor.match_issues_with_csv(issues, rows), [])
+
+    def test_missing_repo_name_does_not_match_missing_repo_name(self):
+        issues = [snyk_issue(target_url=None)]
+        rows = [csv_row(repourl='')]
+        self.assertEqual(self.processor.match_issues_with_csv_df(issues, rows, use_repo_name_matching=True), [])
+
+    def test_df_matches_are_in_csv_row_then_issue_order(self):
+        issues = [snyk_issue('i1', file_path='b.js'), snyk_issue('i2', file_path='a.js'),
+                  snyk_issue('i3', file_path='b.js', cwe='CWE-89'), snyk_issue('i4', file_path='a.js')]
+        rows = [csv_row(file_path='b.js', cwe='89'), csv_row(file_path='a.js'), csv_row(file_path='b.js')]
+        matches = self.processor.match_issues_with_csv_df(issues, rows)
+        self.assertEqual([(issue['key_data']['issue_id'], rows.index(row)) for issue, row in matches],
+                         [('i3', 0), ('i2', 1), ('i4', 1), ('i1', 2)])
+
+    def test_match_uses_dataframe_matcher_only_when_requested(self):
+        # Two issues share the CSV row's keys: the row-by-row matcher keeps the first only
+        issues = [snyk_issue('i1'), snyk_issue('i2')]
+        rows = [csv_row()]
+        default = self.processor.match(issues, rows)
+        self.assertEqual([issue['key_data']['issue_id'] for issue, _ in default], ['i1'])
+        with_df = self.processor.match(issues, rows, use_df_matcher=True)
+        self.assertEqual([issue['key_data']['issue_id'] for issue, _ in with_df], ['i1', 'i2'])
+
+
+class PrefilterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.processor = IssueProcessor(snyk_api=None)
+
+    def enriched_issue(self, url):
+        return {'id': 'issue-1', 'target_info': {'url': url}}
+
+    def test_prefilter_keeps_mixed_case_repo_in_repo_name_mode(self):
+        rows = [csv_row(repourl='https://github.com/Acme/MyRepo')]
+        issues = [self.enriched_issue('https://github.com/Acme/MyRepo'),
+                  self.enriched_issue('https://github.com/Acme/Other')]
+        keys = self.processor.csv_repo_keys(rows, use_repo_name_matching=True)
+        kept = self.processor.prefilter_issues_by_repo(issues, keys, use_repo_name_matching=True)
+        self.assertEqual([issue['target_info']['url'] for issue in kept], ['https://github.com/Acme/MyRepo'])
+
+    def test_prefilter_compares_normalized_urls(self):
+        rows = [csv_row(repourl='https://github.com/acme/webapp/')]
+        issues = [self.enriched_issue('https://GitHub.com/Acme/WebApp'),
+                  self.enriched_issue('https://github.com/acme/other')]
+        keys = self.processor.csv_repo_keys(rows)
+        kept = self.processor.prefilter_issues_by_repo(issues, keys)
+        self.assertEqual([issue['target_info']['url'] for issue in kept], ['https://GitHub.com/Acme/WebApp'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Tests for the severity report written when there are no matches."""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import snyk_ignore_transfer
+from snyk_ignore_transfer import IncrementalSeverityAggregator, IssueProcessor
+
+
+class EmptySeverityReportTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+        # Pin the "Generated:" timestamp so both reports have identical content
+        patcher = mock.patch.object(snyk_ignore_transfer, 'datetime')
+        patcher.start().now.return_value = datetime(2024, 1, 1, 12, 0, 0)
+        self.addCleanup(patcher.stop)
+
+    def read(self, name):
+        with open(os.path.join(self.tmp_dir, name), encoding='utf-8') as f:
+            return f.read()
+
+    def test_empty_report_matches_aggregator_output(self):
+        summaries = [
+            (False, None),
+            (False, IssueProcessor.create_processing_summary([], {'successful_ignores': 0, 'failed_ignores': 0})),
+            (True, {'total_orgs': 3, 'successful_orgs': 2, 'failed_orgs': 1, 'total_matches': 0}),
+        ]
+        for is_group, summary in summaries:
+            with self.subTest(is_group=is_group, summary=summary):
+                fast_file = os.path.join(self.tmp_dir, 'fast.txt')
+                full_file = os.path.join(self.tmp_dir, 'full.txt')
+                self.assertTrue(IssueProcessor(snyk_api=None).generate_severity_report(
+                    [], fast_file, is_group_processing=is_group, processing_summary=summary))
+                aggregator = IncrementalSeverityAggregator()
+                aggregator.add_batch([])
+                self.assertTrue(aggregator.write(full_file, is_group, summary))
+                self.assertEqual(self.read('fast.txt'), self.read('full.txt'))
+
+    def test_empty_report_does_not_build_an_aggregator(self):
+        output_file = os.path.join(self.tmp_dir, 'report.txt')
+        with mock.patch.object(snyk_ignore_transfer, 'IncrementalSeverityAggregator') as aggregator:
+            IssueProcessor(snyk_api=None).generate_severity_report([], output_file)
+        aggregator.assert_not_called()
+        self.assertIn('Total Issues to be Ignored: 0', self.read('report.txt'))
+
+
+if __name__ == '__main__':
+    unittest.main()